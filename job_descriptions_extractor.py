@@ -17,47 +17,166 @@ Each category (Digital, Analog, etc.) gets its own text file with format:
 import os
 import re
 import time
-import random
 import argparse
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+import lxml.html
 from openpyxl import load_workbook
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from datetime import datetime
+from scrape_workers import (
+    CACHE_PATH, CACHE_TTL_SECONDS, LINKEDIN_GUEST_URL,
+    get_worker_driver, get_worker_session, get_worker_cache, wait_for_host, shutdown_workers,
+)
+
+
+# Default number of Chrome instances loading job pages in parallel (--workers)
+MAX_PARALLEL_PAGES = 4
+
+# Category file entries are written in batches of this many jobs
+FLUSH_EVERY = 10
+
+# CSS selectors per job board, shared by the browser and plain-HTTP extractors.
+# Each field lists selectors in priority order; 'min_description' filters out stub matches.
+SITE_SELECTORS = {
+    'linkedin': {
+        # The guest job-posting endpoint renders the title as an h2
+        'title': ['h1.top-card-layout__title', 'h1.topcard__title', 'h2.top-card-layout__title', 'h1'],
+        'company': ['a.topcard__org-name-link', '.topcard__flavor a', 'a[href*="/company/"]'],
+        'description': [
+            '.show-more-less-html__markup',
+            '.description__text',
+            '.jobs-description__content',
+            '.jobs-box__html-content',
+            'div[class*="description"]',
+            '.job-details',
+        ],
+        'min_description': 0,
+    },
+    'greenhouse': {
+        'title': ['h1.app-title, h1[class*="title"]'],
+        'company': ['.company-name, [class*="company"]'],
+        'description': ['#content, .content, [class*="description"]'],
+        'min_description': 0,
+    },
+    'workday': {
+        'title': ['[data-automation-id="jobPostingHeader"], h2[data-automation-id="jobTitle"], h1'],
+        'company': [],
+        'description': ['[data-automation-id="jobPostingDescription"], [class*="jobDescription"]'],
+        'min_description': 0,
+    },
+    'hrmdirect': {
+        'title': ['.careersTitle, h1'],
+        'company': [],
+        'description': ['.jobDesc, div.jobDesc', '.reqResult, #content, body'],
+        'min_description': 0,
+    },
+    'generic': {
+        'title': [
+            'h1[class*="title"]', 'h1[class*="job"]', 'h1[class*="posting"]',
+            'h1[data-automation*="title"]', '.job-title', '.posting-title',
+            'h1', 'h2[class*="title"]'
+        ],
+        'company': [
+            '[class*="company"]', '[data-automation*="company"]',
+            '.employer-name', '.company-name', 'a[href*="/company"]'
+        ],
+        'description': [
+            '[class*="description"]', '[class*="job-content"]',
+            '[data-automation*="description"]', '.job-details',
+            '[class*="posting-content"]', '[class*="job-body"]',
+            'article', '.content'
+        ],
+        'min_description': 50,
+    },
+}
+SITE_SELECTORS['lever'] = SITE_SELECTORS['generic']
+
+# Runs in the page: returns the first match with non-empty text for each selector list,
+# so a whole extraction costs one WebDriver round trip instead of one per selector.
+# The description's innerHTML is only sent when it has list items whose bullets the
+# rendered innerText would lose; otherwise innerText is used as is.
+_QUERY_FIELDS_JS = """
+const pick = (selectors, minLength, keepBullets) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element && element.innerText.trim().length > minLength) {
+            const html = keepBullets && element.querySelector('li') ? element.innerHTML : null;
+            return {text: element.innerText.trim(), html: html};
+        }
+    }
+    return null;
+};
+return {
+    title: pick(arguments[0], 0, false),
+    company: pick(arguments[1], 0, false),
+    description: pick(arguments[2], arguments[3], true)
+};
+"""
+
+# Checked for every spreadsheet row, compiled once; either group holds the job ID
+_LINKEDIN_URL = re.compile(
+    r'linkedin\.com/jobs/(?:view/(?P<view_id>\d+)|search.*currentJobId=(?P<search_id>\d+))'
+)
 
+# Lines of a category txt file entry
+_ENTRY_SEPARATOR = '-' * 40
+_ENTRY_URL = re.compile(r'^URL: (https?://\S+)')
+_ENTRY_STATUS = re.compile(r'^Status: (?:SKIPPED|ERROR)')
+_SEPARATOR_LINE = re.compile(r'^-+$')
 
-def setup_driver():
-    """Set up Chrome driver with options to avoid detection."""
-    chrome_options = Options()
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
+# Characters not allowed in category file names (Windows is the strictest)
+_BAD_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
 
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+# Three or more newlines, i.e. more than one blank line in a row
+_BLANK_LINES = re.compile(r'\n{3,}')
 
+# Text emitted when entering / leaving an element while flattening a description
+_BLOCK_START = {'li': '\n  • ', 'br': '\n'}
+_BLOCK_END = {
+    'p': '\n\n', 'div': '\n',
+    'h1': '\n\n', 'h2': '\n\n', 'h3': '\n\n', 'h4': '\n\n', 'h5': '\n\n', 'h6': '\n\n',
+}
 
-def is_linkedin_job_url(url):
-    """Check if the URL is a valid LinkedIn job URL."""
+
+@dataclass(slots=True)
+class Job:
+    """One tracker row to extract."""
+    row: int
+    url: Optional[str]
+    normalized: Optional[str]
+    existing_company: Optional[str]
+    existing_title: Optional[str]
+    is_linkedin: bool
+
+
+def linkedin_job_id(url):
+    """Return the numeric job ID of a LinkedIn job URL (view or search?currentJobId=), or None."""
     if not url or not isinstance(url, str):
-        return False
+        return None
+    # Substring check first: most non-LinkedIn URLs never reach the regex
+    match = _LINKEDIN_URL.search(url) if 'linkedin.com/jobs/' in url else None
+    return (match['view_id'] or match['search_id']) if match else None
 
-    linkedin_patterns = [
-        r'linkedin\.com/jobs/view/\d+',
-        r'linkedin\.com/jobs/search.*currentJobId=\d+',
-    ]
 
-    return any(re.search(pattern, url) for pattern in linkedin_patterns)
+def classify_url(url):
+    """Return (is_linkedin_job, normalized_url) from a single regex match.
+
+    LinkedIn job URLs normalize to linkedin.com/jobs/view/<id>. Anything else keeps
+    its query string, which often holds the job ID (?req=, ?token=), and only loses
+    the fragment and trailing slash.
+    """
+    if not url or not isinstance(url, str):
+        return False, None
+    jid = linkedin_job_id(url)
+    if jid:
+        return True, f"linkedin.com/jobs/view/{jid}"
+    return False, url.split('#')[0].rstrip('/')
 
 
 def is_valid_url(text):
@@ -79,48 +198,45 @@ def get_url_from_cell(cell):
 
 def format_description_from_html(html):
     """Convert HTML to plain text while preserving bullet points."""
-    import re
+    return format_description_from_element(lxml.html.fragment_fromstring(html, create_parent='div'))
 
-    # Replace <li> tags with bullet points
-    html = re.sub(r'<li[^>]*>', '\n  • ', html)
-    html = re.sub(r'</li>', '', html)
 
-    # Replace <br> tags with newlines
-    html = re.sub(r'<br\s*/?>', '\n', html)
+def format_description_from_element(root):
+    """Convert an already parsed HTML element to plain text while preserving bullet points."""
+    # One pass over the parsed tree: bullets for <li>, line breaks for <br> and
+    # block closings; entities are already decoded by the parser
+    parts = []
+    _flatten_element(root, parts)
+    return clean_description_text(''.join(parts))
 
-    # Replace paragraph/div closings with double newlines
-    html = re.sub(r'</p>', '\n\n', html)
-    html = re.sub(r'</div>', '\n', html)
 
-    # Replace headers with newlines
-    html = re.sub(r'</(h[1-6])>', '\n\n', html)
+def _flatten_element(element, parts):
+    """Append the text of an element and its descendants (not its own tail) to parts.
 
-    # Remove all remaining HTML tags
-    html = re.sub(r'<[^>]+>', '', html)
-
-    # Decode HTML entities
-    html = html.replace('&nbsp;', ' ')
-    html = html.replace('&amp;', '&')
-    html = html.replace('&lt;', '<')
-    html = html.replace('&gt;', '>')
-    html = html.replace('&quot;', '"')
-    html = html.replace('&#39;', "'")
+    Children are visited directly rather than with iterwalk, which skips comment
+    nodes and with them the text that follows LinkedIn's <!----> placeholders.
+    """
+    tag = element.tag if isinstance(element.tag, str) else None  # None for comments / PIs
+    if not tag:
+        return
+    parts.append(_BLOCK_START.get(tag, ''))
+    if tag not in ('script', 'style'):
+        if element.text:
+            parts.append(element.text)
+        for child in element:
+            _flatten_element(child, parts)
+            if child.tail:
+                parts.append(child.tail)
+    parts.append(_BLOCK_END.get(tag, ''))
 
-    # Clean up excessive whitespace
-    lines = html.split('\n')
-    cleaned_lines = []
-    prev_empty = False
 
-    for line in lines:
-        line = line.strip()
-        if line:
-            cleaned_lines.append(line)
-            prev_empty = False
-        elif not prev_empty:
-            cleaned_lines.append('')
-            prev_empty = True
+def clean_description_text(text):
+    """Trim every line and collapse runs of blank lines into one."""
+    text = text.replace('\xa0', ' ')
 
-    return '\n'.join(cleaned_lines).strip()
+    # Strip every line, then collapse blank-line runs in one regex pass
+    text = '\n'.join(line.strip() for line in text.split('\n'))
+    return _BLANK_LINES.sub('\n\n', text).strip()
 
 
 def get_job_site_type(url):
@@ -144,76 +260,105 @@ def get_job_site_type(url):
     return 'generic'
 
 
-def extract_generic_job_info(driver, url):
-    """Extract job info from generic job pages using common patterns."""
-    try:
-        driver.get(url)
-        time.sleep(random.uniform(3, 5))
+def site_requires_js(site_type):
+    """Check if the job board only renders the posting with JavaScript."""
+    return site_type in ('linkedin', 'workday', 'oracle')
 
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
 
-        company = None
-        job_title = None
-        description = None
+def fetch_html(url):
+    """Fetch the server-rendered HTML of a page without a browser.
 
-        # Common title selectors across job sites
-        title_selectors = [
-            'h1[class*="title"]', 'h1[class*="job"]', 'h1[class*="posting"]',
-            'h1[data-automation*="title"]', '.job-title', '.posting-title',
-            'h1', 'h2[class*="title"]'
-        ]
+    Returns raw bytes unless the Content-Type header names a charset, so lxml decodes
+    by the page's own <meta charset> rather than requests' ISO-8859-1 fallback.
+    """
+    response = get_worker_session().get(url, timeout=15)
+    response.raise_for_status()
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.text
+    return response.content
 
-        for selector in title_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element and element.text.strip():
-                    job_title = element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
 
-        # Common company selectors
-        company_selectors = [
-            '[class*="company"]', '[data-automation*="company"]',
-            '.employer-name', '.company-name', 'a[href*="/company"]'
-        ]
+def extract_static_job_info(url, site_type):
+    """Extract job info from server-rendered HTML fetched over plain HTTP."""
+    try:
+        tree = lxml.html.fromstring(fetch_html(url))
+    except Exception as e:
+        print(f"    HTTP fetch error: {str(e)}")
+        return None
 
-        for selector in company_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element and element.text.strip():
-                    company = element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
+    selectors = SITE_SELECTORS.get(site_type, SITE_SELECTORS['generic'])
 
-        # Common description selectors
-        desc_selectors = [
-            '[class*="description"]', '[class*="job-content"]',
-            '[data-automation*="description"]', '.job-details',
-            '[class*="posting-content"]', '[class*="job-body"]',
-            'article', '.content'
-        ]
+    def first_text(selector_list):
+        for selector in selector_list:
+            elements = tree.cssselect(selector)
+            if elements:
+                text = ' '.join(elements[0].text_content().split())
+                if text:
+                    return text
+        return None
 
-        for selector in desc_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element:
-                    html = element.get_attribute('innerHTML')
-                    if html and len(html) > 100:
-                        description = format_description_from_html(html)
-                        if description and len(description) > 50:
-                            break
-            except NoSuchElementException:
-                continue
+    description = None
+    for selector in selectors['description']:
+        elements = tree.cssselect(selector)
+        if elements:
+            description = format_description_from_element(elements[0])
+            if description and len(description) > selectors['min_description']:
+                break
+            description = None
+
+    return {
+        'company': first_text(selectors['company']),
+        'job_title': first_text(selectors['title']),
+        'description': description
+    }
+
+
+def query_job_fields(driver, selectors):
+    """Read title, company and description from the loaded page in a single script call."""
+    result = driver.execute_script(
+        _QUERY_FIELDS_JS,
+        selectors['title'], selectors['company'], selectors['description'],
+        selectors['min_description']
+    )
+
+    job_title = result['title']['text'] if result['title'] else None
+    company = result['company']['text'] if result['company'] else None
+    description = None
+    if result['description']:
+        if result['description']['html']:
+            description = format_description_from_html(result['description']['html'])
+        else:
+            description = clean_description_text(result['description']['text'])
+        description = description or None
+
+    return {
+        'company': company,
+        'job_title': job_title,
+        'description': description
+    }
+
+
+def wait_for_any(driver, selectors, timeout):
+    """Wait until any of the selectors is present in the page.
+
+    Returns False on timeout so the caller can still read whatever did load.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(selectors)))
+        )
+        return True
+    except TimeoutException:
+        return False
 
-        return {
-            'company': company,
-            'job_title': job_title,
-            'description': description
-        }
+
+def extract_generic_job_info(driver, url):
+    """Extract job info from generic job pages using common patterns."""
+    try:
+        driver.get(url)
+        wait_for_any(driver, SITE_SELECTORS['generic']['description'], 15)
+
+        return query_job_fields(driver, SITE_SELECTORS['generic'])
 
     except TimeoutException:
         print(f"    Timeout loading page")
@@ -227,43 +372,9 @@ def extract_greenhouse_job_info(driver, url):
     """Extract job info from Greenhouse job pages."""
     try:
         driver.get(url)
-        time.sleep(random.uniform(2, 4))
-
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        wait_for_any(driver, SITE_SELECTORS['greenhouse']['description'], 15)
 
-        company = None
-        job_title = None
-        description = None
-
-        # Greenhouse-specific selectors
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, 'h1.app-title, h1[class*="title"]')
-            job_title = element.text.strip() if element else None
-        except NoSuchElementException:
-            pass
-
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, '.company-name, [class*="company"]')
-            company = element.text.strip() if element else None
-        except NoSuchElementException:
-            pass
-
-        # Job description
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, '#content, .content, [class*="description"]')
-            if element:
-                html = element.get_attribute('innerHTML')
-                description = format_description_from_html(html) if html else None
-        except NoSuchElementException:
-            pass
-
-        return {
-            'company': company,
-            'job_title': job_title,
-            'description': description
-        }
+        return query_job_fields(driver, SITE_SELECTORS['greenhouse'])
 
     except Exception as e:
         print(f"    Greenhouse error: {str(e)}")
@@ -274,40 +385,14 @@ def extract_workday_job_info(driver, url):
     """Extract job info from Workday job pages."""
     try:
         driver.get(url)
-        time.sleep(random.uniform(3, 5))
+        wait_for_any(driver, SITE_SELECTORS['workday']['description'], 15)
 
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-
-        company = None
-        job_title = None
-        description = None
-
-        # Workday-specific selectors
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, '[data-automation-id="jobPostingHeader"], h2[data-automation-id="jobTitle"], h1')
-            job_title = element.text.strip() if element else None
-        except NoSuchElementException:
-            pass
+        info = query_job_fields(driver, SITE_SELECTORS['workday'])
 
-        # Description - Workday often has it in a specific div
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, '[data-automation-id="jobPostingDescription"], [class*="jobDescription"]')
-            if element:
-                html = element.get_attribute('innerHTML')
-                description = format_description_from_html(html) if html else None
-        except NoSuchElementException:
-            pass
-
-        if not description:
+        if not info['description']:
             return extract_generic_job_info(driver, url)
 
-        return {
-            'company': company,
-            'job_title': job_title,
-            'description': description
-        }
+        return info
 
     except Exception as e:
         print(f"    Workday error: {str(e)}")
@@ -318,58 +403,47 @@ def extract_hrmdirect_job_info(driver, url):
     """Extract job info from HRMDirect job pages."""
     try:
         driver.get(url)
-        time.sleep(random.uniform(2, 4))
-
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        wait_for_any(driver, SITE_SELECTORS['hrmdirect']['description'], 15)
 
-        company = None
-        job_title = None
-        description = None
-
-        # HRMDirect-specific selectors
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, '.careersTitle, h1')
-            job_title = element.text.strip() if element else None
-        except NoSuchElementException:
-            pass
-
-        # Job description - HRMDirect uses .jobDesc
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, '.jobDesc, div.jobDesc')
-            if element:
-                html = element.get_attribute('innerHTML')
-                description = format_description_from_html(html) if html else None
-        except NoSuchElementException:
-            pass
-
-        # If .jobDesc didn't work, try getting all content after the title
-        if not description:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, '.reqResult, #content, body')
-                if element:
-                    html = element.get_attribute('innerHTML')
-                    description = format_description_from_html(html) if html else None
-            except NoSuchElementException:
-                pass
-
-        return {
-            'company': company,
-            'job_title': job_title,
-            'description': description
-        }
+        # Falls back from .jobDesc to the whole content area when it is empty
+        return query_job_fields(driver, SITE_SELECTORS['hrmdirect'])
 
     except Exception as e:
         print(f"    HRMDirect error: {str(e)}")
         return extract_generic_job_info(driver, url)
 
 
-def extract_job_info_any(driver, url):
-    """Extract job info from any supported job site."""
+def extract_job_info_any(url):
+    """Extract job info from any supported job site.
+
+    Server-rendered job boards and LinkedIn's guest job endpoint are fetched over
+    plain HTTP first; the worker's browser is only used for JavaScript sites or when
+    that finds no description.
+    """
     site_type = get_job_site_type(url)
     print(f"    Site type: {site_type}")
 
+    # LinkedIn's guest endpoint and server-rendered boards need no browser
+    static_url = None
+    if site_type == 'linkedin':
+        jid = linkedin_job_id(url)
+        static_url = LINKEDIN_GUEST_URL.format(jid) if jid else None
+    elif not site_requires_js(site_type):
+        static_url = url
+
+    if static_url:
+        wait_for_host(static_url)
+        info = extract_static_job_info(static_url, site_type)
+        if info and info['description']:
+            return info
+
+    try:
+        driver = get_worker_driver()
+    except WebDriverException as e:
+        print(f"    Could not start Chrome: {e.msg}")
+        return None
+
+    wait_for_host(url)
     if site_type == 'linkedin':
         return extract_job_info(driver, url)
     elif site_type == 'greenhouse':
@@ -386,72 +460,27 @@ def extract_job_info(driver, url):
     """Extract job title, company, and description from a LinkedIn job page."""
     try:
         driver.get(url)
-        time.sleep(random.uniform(2, 4))
-
-        company = None
-        job_title = None
-        description = None
-
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-
-        # Extract job title
-        for selector in ['h1.top-card-layout__title', 'h1.topcard__title', 'h1']:
+        wait_for_any(driver, SITE_SELECTORS['linkedin']['description'], 10)
+
+        # Click "Show more" to expand the description; find_elements returns [] when
+        # the button is absent (or already expanded) instead of raising
+        buttons = driver.find_elements(By.CSS_SELECTOR, '.show-more-less-html__button--more')
+        markups = driver.find_elements(By.CSS_SELECTOR, '.show-more-less-html__markup')
+        if buttons and markups:
+            markup = markups[0]
+            collapsed_length = len(markup.text)
             try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element and element.text.strip():
-                    job_title = element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
-
-        # Extract company name
-        for selector in ['a.topcard__org-name-link', '.topcard__flavor a', 'a[href*="/company/"]']:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element and element.text.strip():
-                    company = element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
-
-        # Try to click "Show more" button to expand description
-        try:
-            show_more_btn = driver.find_element(By.CSS_SELECTOR, '.show-more-less-html__button--more')
-            show_more_btn.click()
-            time.sleep(0.5)
-        except:
-            pass  # Button may not exist or already expanded
-
-        # Extract job description with bullet points preserved
-        description_selectors = [
-            '.show-more-less-html__markup',
-            '.description__text',
-            '.jobs-description__content',
-            '.jobs-box__html-content',
-            'div[class*="description"]',
-            '.job-details',
-        ]
-
-        for selector in description_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element:
-                    # Get inner HTML and convert to text with bullets preserved
-                    html = element.get_attribute('innerHTML')
-                    if html:
-                        description = format_description_from_html(html)
-                        if description:
-                            break
-            except NoSuchElementException:
-                continue
-
-        return {
-            'company': company,
-            'job_title': job_title,
-            'description': description
-        }
+                buttons[0].click()
+                # Expanded once the text grows or the markup drops its clamp class
+                WebDriverWait(driver, 2).until(
+                    lambda d: len(markup.text) > collapsed_length
+                    or 'clamp' not in (markup.get_attribute('class') or '')
+                )
+            except WebDriverException:
+                pass  # Button not clickable or no visible change; read what is there
+
+        # Title, company and description (bullet points preserved) in one round trip
+        return query_job_fields(driver, SITE_SELECTORS['linkedin'])
 
     except TimeoutException:
         print(f"    Timeout loading page")
@@ -461,9 +490,97 @@ def extract_job_info(driver, url):
         return None
 
 
+def process_job(url):
+    """Extract a single job in a worker thread using that thread's own browser/session.
+
+    Fresh successful results come from the cache; new results are recorded in it.
+    Returns None without starting a browser when there is no URL.
+    """
+    if not url:
+        return None
+
+    cache = get_worker_cache(open_cache)
+    info = get_cached_job(cache, url)
+    if info:
+        print(f"    Using cached result")
+        return info
+
+    info = extract_job_info_any(url)
+    store_cached_job(cache, url, info)
+    return info
+
+
+def open_cache(path=CACHE_PATH):
+    """Open the extraction cache, creating the database and table if needed."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS jobs("
+        "url TEXT PRIMARY KEY, company TEXT, title TEXT, description TEXT, status TEXT, ts REAL)"
+    )
+    return conn
+
+
+def get_cached_job(conn, url):
+    """Return cached job info if the URL was extracted successfully within the TTL, else None."""
+    row = conn.execute(
+        "SELECT company, title, description FROM jobs WHERE url = ? AND status = 'ok' AND ts > ?",
+        (normalize_url(url), time.time() - CACHE_TTL_SECONDS)
+    ).fetchone()
+    if not row:
+        return None
+    return {'company': row[0], 'job_title': row[1], 'description': row[2]}
+
+
+def store_cached_job(conn, url, info):
+    """Record an extraction result in the cache.
+
+    Only a result with a description counts as 'ok'; info=None or a result without
+    a description is recorded as an 'error', which get_cached_job never serves.
+    """
+    if info and info['description']:
+        values = (info['company'], info['job_title'], info['description'], 'ok')
+    else:
+        values = (None, None, None, 'error')
+    conn.execute(
+        "INSERT OR REPLACE INTO jobs(url, company, title, description, status, ts) VALUES (?, ?, ?, ?, ?, ?)",
+        (normalize_url(url),) + values + (time.time(),)
+    )
+    conn.commit()
+
+
+def extract_jobs(executor, urls):
+    """Submit each distinct URL to the worker pool once.
+
+    Returns a dict mapping normalized URL -> Future of its job info (None on failure).
+    Rows that share a job (same normalized URL, e.g. across categories, or LinkedIn
+    links with different tracking params) share one future, so the page is only loaded once.
+    """
+    futures = {}
+    for url in urls:
+        normalized = normalize_url(url)
+        if normalized and normalized not in futures:
+            futures[normalized] = executor.submit(process_job, url)
+
+    duplicates = sum(1 for url in urls if normalize_url(url)) - len(futures)
+    if duplicates:
+        print(f"  {duplicates} duplicate URLs will reuse an earlier extraction")
+
+    return futures
+
+
+def format_entry(company, title, url, description=None, status=None):
+    """Build one job entry for a category file, including its trailing separator."""
+    entry = f"Company: {company or 'N/A'}\nJob Title: {title or 'N/A'}\nURL: {url}\n"
+    if status:
+        entry += f"Status: {status}\n"
+    else:
+        entry += f"\n{description}\n"
+    return entry + f"\n{'-'*40}\n\n"
+
+
 def sanitize_filename(name):
     """Remove invalid characters from filename."""
-    return re.sub(r'[<>:"/\\|?*]', '', name)
+    return _BAD_FILENAME_CHARS.sub('', name)
 
 
 def cleanup_skipped_entries(filename):
@@ -489,13 +606,13 @@ def cleanup_skipped_entries(filename):
             part = parts[i]
 
             # Check if this is a job entry (not a separator)
-            if not re.match(r'^-+$', part.strip()):
+            if not _SEPARATOR_LINE.match(part.strip()):
                 # Check if this entry has SKIPPED or ERROR status
                 if 'Status: SKIPPED' in part or 'Status: ERROR' in part:
                     removed += 1
                     # Skip this part and its following separator
                     i += 1
-                    if i < len(parts) and re.match(r'^-+$', parts[i].strip()):
+                    if i < len(parts) and _SEPARATOR_LINE.match(parts[i].strip()):
                         i += 1
                     continue
 
@@ -506,7 +623,7 @@ def cleanup_skipped_entries(filename):
             # Write cleaned content
             new_content = ''.join(new_parts)
             # Clean up any trailing empty sections
-            new_content = re.sub(r'\n{3,}', '\n\n', new_content)
+            new_content = _BLANK_LINES.sub('\n\n', new_content)
             new_content = new_content.rstrip() + '\n'
 
             with open(filename, 'w', encoding='utf-8') as f:
@@ -553,7 +670,7 @@ def replace_entry_in_file(filename, url, new_entry_content):
                     replaced = True
                     i += 1
                     # Skip the separator after this entry
-                    if i < len(entries) and re.match(r'^-+$', entries[i].strip()):
+                    if i < len(entries) and _SEPARATOR_LINE.match(entries[i].strip()):
                         new_entries.append(entries[i])
                         i += 1
                     continue
@@ -563,7 +680,7 @@ def replace_entry_in_file(filename, url, new_entry_content):
 
         if replaced:
             new_content = ''.join(new_entries)
-            new_content = re.sub(r'\n{3,}', '\n\n', new_content)
+            new_content = _BLANK_LINES.sub('\n\n', new_content)
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(new_content)
 
@@ -613,19 +730,15 @@ def get_unresolved_from_files(categories):
 
 
 def normalize_url(url):
-    """Normalize LinkedIn URL for comparison (remove tracking params)."""
-    if not url:
-        return None
-    # Extract the base job ID from LinkedIn URLs
-    match = re.search(r'linkedin\.com/jobs/view/(\d+)', url)
-    if match:
-        return f"linkedin.com/jobs/view/{match.group(1)}"
-    return url.split('?')[0].rstrip('/')
+    """Normalize a job URL for comparison (LinkedIn jobs by ID, others without fragment)."""
+    return classify_url(url)[1]
 
 
 def get_existing_urls(filename):
     """Parse an existing txt file and return dict of URLs with their status.
 
+    The file is streamed line by line; an entry ends at its dashed separator line.
+
     Returns:
         dict with 'extracted' (successfully extracted URLs) and 'skipped' (URLs marked as SKIPPED)
     """
@@ -633,29 +746,35 @@ def get_existing_urls(filename):
     if not os.path.exists(filename):
         return result
 
+    def record(url, skipped):
+        normalized = normalize_url(url)
+        if normalized:
+            result['skipped' if skipped else 'extracted'].add(normalized)
+
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-            # Split by job entries (separated by dashes)
-            entries = re.split(r'-{40,}', content)
-
-            for entry in entries:
-                # Find URL in this entry
-                url_match = re.search(r'URL: (https?://[^\s\n]+)', entry)
-                if not url_match:
+            url = None
+            skipped = False
+
+            for line in f:
+                if line.startswith(_ENTRY_SEPARATOR):
+                    record(url, skipped)
+                    url = None
+                    skipped = False
                     continue
 
-                url = url_match.group(1)
-                normalized = normalize_url(url)
-                if not normalized:
-                    continue
+                if url is None:
+                    url_match = _ENTRY_URL.match(line)
+                    if url_match:
+                        url = url_match.group(1)
+                        continue
 
                 # Check if this entry was skipped
-                if 'Status: SKIPPED' in entry or 'Status: ERROR' in entry:
-                    result['skipped'].add(normalized)
-                else:
-                    result['extracted'].add(normalized)
+                if _ENTRY_STATUS.match(line):
+                    skipped = True
+
+            # Last entry may not have a trailing separator
+            record(url, skipped)
 
     except Exception as e:
         print(f"Warning: Could not read existing file {filename}: {e}")
@@ -730,12 +849,19 @@ def main():
                         help='Retry all unresolved entries from txt files (replaces in-place)')
     parser.add_argument('--summary', action='store_true',
                         help='Only show summary of current state, no extraction')
+    parser.add_argument('--skip-existing', type=float, metavar='HOURS',
+                        help='Skip categories whose txt file was modified within the last HOURS hours')
+    parser.add_argument('--workers', type=int, default=MAX_PARALLEL_PAGES,
+                        help=f'Number of parallel browser workers, one Chrome each (default: {MAX_PARALLEL_PAGES})')
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
 
     excel_path = "Job Tracker.xlsx"
 
     # Get categories from existing files if we're doing cleanup/retry without Excel
     all_categories = ['Digital', 'Analog', 'Embedded', 'hardware', 'Power', 'AI/ML', 'Controls']
+    cat_files = {category: f"{sanitize_filename(category)}_jobs.txt" for category in all_categories}
 
     # Handle --report flag - detailed report of issues
     if args.report:
@@ -779,8 +905,7 @@ def main():
         print("Cleaning up SKIPPED/ERROR entries from txt files...")
         total_removed = 0
         for category in all_categories:
-            filename = f"{sanitize_filename(category)}_jobs.txt"
-            removed = cleanup_skipped_entries(filename)
+            removed = cleanup_skipped_entries(cat_files[category])
             if removed > 0:
                 print(f"  {category}: removed {removed} entries")
                 total_removed += removed
@@ -799,22 +924,26 @@ def main():
 
         print(f"Found {len(unresolved)} unresolved entries to retry")
 
-        # Set up browser and retry
-        print("\nSetting up browser...")
-        driver = setup_driver()
+        # Start browser workers and retry
+        print(f"\nStarting {args.workers} browser workers...")
+        executor = ThreadPoolExecutor(max_workers=args.workers)
         errors = []
         successes = []
 
         try:
+            futures = extract_jobs(executor, [job['url'] for job in unresolved])
+
             for i, job in enumerate(unresolved):
                 url = job['url']
                 category = job['category']
-                filename = f"{sanitize_filename(category)}_jobs.txt"
+                filename = cat_files[category]
 
                 print(f"\n[{i+1}/{len(unresolved)}] {category}...")
                 print(f"  URL: {url[:50]}...")
 
-                info = extract_job_info_any(driver, url)
+                # No future when the URL normalizes to nothing (e.g. '/')
+                future = futures.get(normalize_url(url))
+                info = future.result() if future else None
 
                 if info and info.get('description'):
                     company = info['company'] or job['existing_company'] or 'N/A'
@@ -835,17 +964,14 @@ def main():
                         print(f"  Success (appended): {company} - {title}")
                         # If not found, append
                         with open(filename, 'a', encoding='utf-8') as f:
-                            f.write(new_entry)
-                            f.write(f"\n{'-'*40}\n\n")
+                            f.write(f"{new_entry}\n{'-'*40}\n\n")
                         successes.append(f"{category}: {company}")
                 else:
                     print(f"  Failed to extract")
                     errors.append({'category': category, 'url': url, 'company': job['existing_company']})
 
-                time.sleep(random.uniform(2, 4))
-
         finally:
-            driver.quit()
+            shutdown_workers(executor)
 
         print(f"\n{'='*60}")
         print(f"Retry complete: {len(successes)} succeeded, {len(errors)} failed")
@@ -856,15 +982,15 @@ def main():
         return
 
     print(f"Reading {excel_path}...")
+    # Not read_only: read-only worksheets drop cell hyperlinks, which hold the job URLs
     wb = load_workbook(excel_path)
     ws = wb.active
 
     # Find column indices
     headers = {}
-    for col in range(1, ws.max_column + 1):
-        header = ws.cell(row=1, column=col).value
-        if header:
-            headers[header] = col
+    for cell in next(ws.iter_rows(min_row=1, max_row=1)):
+        if cell.value:
+            headers[cell.value] = cell.column
 
     print(f"Headers found: {headers}")
 
@@ -876,8 +1002,9 @@ def main():
     jobs_by_category = {}
     errors = []
 
-    for row in range(2, ws.max_row + 1):
-        category = ws.cell(row=row, column=category_col).value
+    last_col = max(category_col, company_col, job_title_col)
+    for cells in ws.iter_rows(min_row=2, max_col=last_col):
+        category = cells[category_col - 1].value
         if not category:
             continue
 
@@ -886,24 +1013,26 @@ def main():
             jobs_by_category[category] = []
 
         # Get URL from Job Title column hyperlink
-        job_title_cell = ws.cell(row=row, column=job_title_col)
+        job_title_cell = cells[job_title_col - 1]
         url = get_url_from_cell(job_title_cell)
 
         # Get existing company/title from spreadsheet as fallback
-        existing_company = ws.cell(row=row, column=company_col).value
+        existing_company = cells[company_col - 1].value
         existing_title = job_title_cell.value
 
-        jobs_by_category[category].append({
-            'row': row,
-            'url': url,
-            'existing_company': existing_company,
-            'existing_title': existing_title,
-            'is_linkedin': is_linkedin_job_url(url) if url else False
-        })
+        is_linkedin, normalized = classify_url(url)
+        jobs_by_category[category].append(Job(
+            row=job_title_cell.row,
+            url=url,
+            normalized=normalized,
+            existing_company=existing_company,
+            existing_title=existing_title,
+            is_linkedin=is_linkedin
+        ))
 
     # Count jobs
     total_jobs = sum(len(jobs) for jobs in jobs_by_category.values())
-    linkedin_jobs = sum(1 for jobs in jobs_by_category.values() for job in jobs if job['is_linkedin'])
+    linkedin_jobs = sum(1 for jobs in jobs_by_category.values() for job in jobs if job.is_linkedin)
 
     print(f"\nFound {total_jobs} jobs across {len(jobs_by_category)} categories")
     print(f"LinkedIn jobs: {linkedin_jobs}")
@@ -911,21 +1040,28 @@ def main():
     print(f"\nCategories: {list(jobs_by_category.keys())}")
 
     # Check existing files and filter out already-extracted jobs
+    for category in jobs_by_category:
+        cat_files.setdefault(category, f"{sanitize_filename(category)}_jobs.txt")
     jobs_to_extract = {}
     total_new_jobs = 0
     total_already_done = 0
     total_retry_skipped = 0
+    fresh_after = time.time() - args.skip_existing * 3600 if args.skip_existing is not None else None
 
     for category, jobs in jobs_by_category.items():
-        filename = f"{sanitize_filename(category)}_jobs.txt"
+        filename = cat_files[category]
+        if fresh_after is not None and os.path.exists(filename) and os.path.getmtime(filename) >= fresh_after:
+            # Recently written: leave the whole category alone, no page loads
+            print(f"  {category}: {filename} updated within {args.skip_existing:g}h, skipping")
+            continue
+
         url_status = get_existing_urls(filename)
         extracted_urls = url_status['extracted']
         skipped_urls = url_status['skipped']
 
         new_jobs = []
         for job in jobs:
-            url = job['url']
-            normalized = normalize_url(url) if url else None
+            normalized = job.normalized
 
             if normalized and normalized in extracted_urls:
                 # Already successfully extracted
@@ -963,11 +1099,17 @@ def main():
         print_final_summary(jobs_by_category)
         return
 
-    # Set up browser
-    print("\nSetting up browser...")
-    driver = setup_driver()
+    # Start browser workers; each one keeps its own Chrome across all categories
+    print(f"\nStarting {args.workers} browser workers...")
+    executor = ThreadPoolExecutor(max_workers=args.workers)
 
     try:
+        # Queue every category up front so workers keep loading pages while results are
+        # written; a job listed in several rows/categories is extracted once for all of them
+        futures = extract_jobs(
+            executor, [job.url for data in jobs_to_extract.values() for job in data['jobs']]
+        )
+
         processed = 0
         for category, data in jobs_to_extract.items():
             jobs = data['jobs']
@@ -984,23 +1126,22 @@ def main():
             # Append to existing file or create new one
             mode = 'a' if data['file_exists'] else 'w'
 
-            with open(filename, mode, encoding='utf-8') as f:
-                # Write header only for new files
+            # Large buffer: entries are already batched, this keeps flushes to one syscall
+            with open(filename, mode, encoding='utf-8', buffering=1 << 20) as f:
+                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 if not data['file_exists']:
-                    f.write(f"{'='*60}\n")
-                    f.write(f"Category: {category}\n")
-                    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"{'='*60}\n\n")
+                    # Write header only for new files
+                    f.write(f"{'='*60}\nCategory: {category}\nGenerated: {timestamp}\n{'='*60}\n\n")
                 else:
                     # Add a separator for appended content
-                    f.write(f"\n{'='*60}\n")
-                    f.write(f"Appended: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"{'='*60}\n\n")
+                    f.write(f"\n{'='*60}\nAppended: {timestamp}\n{'='*60}\n\n")
 
-                for i, job in enumerate(jobs):
+                # Entries are built as whole strings and written in batches
+                buf = []
+                for job in jobs:
                     processed += 1
-                    row = job['row']
-                    url = job['url']
+                    row = job.row
+                    url = job.url
 
                     print(f"\n[{processed}/{total_new_jobs}] Row {row}...")
 
@@ -1010,48 +1151,44 @@ def main():
                         errors.append(error_msg)
                         print(f"  Skipping: {error_msg}")
 
-                        f.write(f"Company: {job['existing_company'] or 'N/A'}\n")
-                        f.write(f"Job Title: {job['existing_title'] or 'N/A'}\n")
-                        f.write(f"URL: N/A\n")
-                        f.write(f"Status: SKIPPED - No URL\n")
-                        f.write(f"\n{'-'*40}\n\n")
-                        continue
+                        buf.append(format_entry(job.existing_company, job.existing_title, 'N/A',
+                                                status="SKIPPED - No URL"))
+                    else:
+                        print(f"  URL: {url[:50]}...")
 
-                    print(f"  URL: {url[:50]}...")
-                    info = extract_job_info_any(driver, url)
+                        # No future when the URL normalizes to nothing (e.g. '/')
+                        future = futures.get(job.normalized)
+                        info = future.result() if future else None
+                        if info:
+                            company = info['company'] or job.existing_company or 'N/A'
+                            title = info['job_title'] or job.existing_title or 'N/A'
+                            description = info['description'] or 'No description available'
 
-                    if info:
-                        company = info['company'] or job['existing_company'] or 'N/A'
-                        title = info['job_title'] or job['existing_title'] or 'N/A'
-                        description = info['description'] or 'No description available'
+                            print(f"  Company: {company}")
+                            print(f"  Title: {title}")
+                            print(f"  Description: {len(description)} chars")
 
-                        print(f"  Company: {company}")
-                        print(f"  Title: {title}")
-                        print(f"  Description: {len(description)} chars")
+                            buf.append(format_entry(company, title, url, description=description))
+                        else:
+                            error_msg = f"Row {row}: Failed to extract - {url[:50]}..."
+                            errors.append(error_msg)
+                            print(f"  ERROR: Failed to extract")
 
-                        f.write(f"Company: {company}\n")
-                        f.write(f"Job Title: {title}\n")
-                        f.write(f"URL: {url}\n")
-                        f.write(f"\n{description}\n")
-                        f.write(f"\n{'-'*40}\n\n")
-                    else:
-                        error_msg = f"Row {row}: Failed to extract - {url[:50]}..."
-                        errors.append(error_msg)
-                        print(f"  ERROR: Failed to extract")
+                            buf.append(format_entry(job.existing_company, job.existing_title, url,
+                                                    status="ERROR - Failed to extract description"))
 
-                        f.write(f"Company: {job['existing_company'] or 'N/A'}\n")
-                        f.write(f"Job Title: {job['existing_title'] or 'N/A'}\n")
-                        f.write(f"URL: {url}\n")
-                        f.write(f"Status: ERROR - Failed to extract description\n")
-                        f.write(f"\n{'-'*40}\n\n")
+                    # Flush periodically so a crash loses at most a few entries
+                    if len(buf) >= FLUSH_EVERY:
+                        f.write(''.join(buf))
+                        f.flush()
+                        buf.clear()
 
-                    # Random delay
-                    time.sleep(random.uniform(2, 4))
+                f.write(''.join(buf))
 
             print(f"\nSaved: {filename}")
 
     finally:
-        driver.quit()
+        shutdown_workers(executor)
 
     # Write error log
     if errors:
@@ -11,34 +11,95 @@ It handles both:
 
 import re
 import time
-import random
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+import lxml.html
 from openpyxl import load_workbook
 from openpyxl.worksheet.hyperlink import Hyperlink
 from openpyxl.styles import Font
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from scrape_workers import (
+    CACHE_PATH, CACHE_TTL_SECONDS, LINKEDIN_GUEST_URL,
+    get_worker_driver, get_worker_session, get_worker_cache, wait_for_host, shutdown_workers,
+)
+
+
+# Canonical page of a job; search?currentJobId= links open the same posting here
+LINKEDIN_VIEW_URL = "https://www.linkedin.com/jobs/view/{}/"
+
+# Selectors tried in order, shared by the guest-endpoint and browser extractors
+TITLE_SELECTORS = [
+    "h1.top-card-layout__title",
+    "h1.topcard__title",
+    "h2.top-card-layout__title",  # Guest endpoint
+    "h1[class*='job-title']",
+    ".job-details-jobs-unified-top-card__job-title h1",
+    ".jobs-unified-top-card__job-title",
+    "h1",
+]
+COMPANY_SELECTORS = [
+    "a.topcard__org-name-link",
+    ".topcard__flavor a",
+    "a[class*='company-name']",
+    ".job-details-jobs-unified-top-card__company-name a",
+    ".jobs-unified-top-card__company-name a",
+    ".top-card-layout__card a[data-tracking-control-name*='company']",
+    "a[href*='/company/']",
+]
+TIME_SELECTORS = [
+    ".posted-time-ago__text",
+    ".topcard__flavor--metadata span",
+    "span[class*='posted']",
+    ".job-details-jobs-unified-top-card__primary-description-container span",
+    ".jobs-unified-top-card__posted-date",
+]
+TIME_WORDS = ['ago', 'hour', 'day', 'week', 'month', 'minute']
+
+# Runs every selector list in the page, so a job costs one WebDriver call instead of
+# one per selector; arguments are the three selector lists and TIME_WORDS
+_QUERY_DETAILS_JS = """
+const pick = (selectors) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element && element.innerText.trim()) {
+            return element.innerText.trim();
+        }
+    }
+    return null;
+};
+const pickTime = (selectors, words) => {
+    for (const selector of selectors) {
+        for (const element of document.querySelectorAll(selector)) {
+            const text = element.innerText.trim();
+            if (words.some(word => text.toLowerCase().includes(word))) {
+                return text;
+            }
+        }
+    }
+    return null;
+};
+return {
+    title: pick(arguments[0]),
+    company: pick(arguments[1]),
+    posted: pickTime(arguments[2], arguments[3])
+};
+"""
+
+# Rows filled in between workbook saves; each save rewrites the whole file
+SAVE_EVERY = 20
 
+# Number of Chrome instances loading job pages in parallel
+MAX_PARALLEL_PAGES = 4
 
-def setup_driver():
-    """Set up Chrome driver with options to avoid detection."""
-    chrome_options = Options()
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
+# Matches job view and search?currentJobId= URLs; group 1 is the job ID
+_JOB_ID = re.compile(r'linkedin\.com/jobs/(?:view/|search.*currentJobId=)(\d+)')
 
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+# "3 days ago", "1 week ago", ...; minutes and hours count as posted today
+_POSTED_TIME = re.compile(r'(\d+)\s*(minute|hour|day|week|month)')
+_DAYS_PER_UNIT = {'minute': 0, 'hour': 0, 'day': 1, 'week': 7, 'month': 30}
 
 
 def is_linkedin_job_url(url):
@@ -46,12 +107,14 @@ def is_linkedin_job_url(url):
     if not url or not isinstance(url, str):
         return False
 
-    linkedin_patterns = [
-        r'linkedin\.com/jobs/view/\d+',
-        r'linkedin\.com/jobs/search.*currentJobId=\d+',
-    ]
+    # Substring check first: most non-LinkedIn URLs never reach the regex
+    return 'linkedin.com/jobs/' in url and _JOB_ID.search(url) is not None
 
-    return any(re.search(pattern, url) for pattern in linkedin_patterns)
+
+def job_id(url):
+    """Return the numeric LinkedIn job ID of a job URL, or None."""
+    match = _JOB_ID.search(url) if url else None
+    return match.group(1) if match else None
 
 
 def get_url_from_cell(cell):
@@ -71,77 +134,19 @@ def extract_job_details(driver, url):
     """Extract job details from a LinkedIn job page."""
     try:
         driver.get(url)
-        time.sleep(random.uniform(2, 4))  # Random delay to avoid detection
-
-        company = None
-        job_title = None
-        posted_time = None
 
-        # Wait for page to load
+        # Wait until the title is in the page rather than for a fixed delay
         WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
+            EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(TITLE_SELECTORS)))
         )
 
-        # Try multiple selectors for job title
-        title_selectors = [
-            "h1.top-card-layout__title",
-            "h1.topcard__title",
-            "h1[class*='job-title']",
-            ".job-details-jobs-unified-top-card__job-title h1",
-            ".jobs-unified-top-card__job-title",
-            "h1",
-        ]
-
-        for selector in title_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element and element.text.strip():
-                    job_title = element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
-
-        # Try multiple selectors for company name
-        company_selectors = [
-            "a.topcard__org-name-link",
-            ".topcard__flavor a",
-            "a[class*='company-name']",
-            ".job-details-jobs-unified-top-card__company-name a",
-            ".jobs-unified-top-card__company-name a",
-            ".top-card-layout__card a[data-tracking-control-name*='company']",
-            "a[href*='/company/']",
-        ]
-
-        for selector in company_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element and element.text.strip():
-                    company = element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
-
-        # Try multiple selectors for posted time
-        time_selectors = [
-            ".posted-time-ago__text",
-            ".topcard__flavor--metadata span",
-            "span[class*='posted']",
-            ".job-details-jobs-unified-top-card__primary-description-container span",
-            ".jobs-unified-top-card__posted-date",
-        ]
-
-        for selector in time_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    text = element.text.strip().lower()
-                    if any(word in text for word in ['ago', 'hour', 'day', 'week', 'month', 'minute']):
-                        posted_time = element.text.strip()
-                        break
-                if posted_time:
-                    break
-            except NoSuchElementException:
-                continue
+        # Try every title, company and posted-time selector in a single script call
+        result = driver.execute_script(
+            _QUERY_DETAILS_JS, TITLE_SELECTORS, COMPANY_SELECTORS, TIME_SELECTORS, TIME_WORDS
+        )
+        job_title = result['title']
+        company = result['company']
+        posted_time = result['posted']
 
         # Convert posted time to days
         days_ago = parse_posted_time(posted_time) if posted_time else None
@@ -160,47 +165,152 @@ def extract_job_details(driver, url):
         return None
 
 
-def parse_posted_time(time_str):
-    """Convert posted time string to number of days."""
-    if not time_str:
+def extract_guest_job_details(url):
+    """Extract job details from LinkedIn's guest job-posting endpoint, without a browser.
+
+    Returns None when the endpoint fails or has no job title; the caller falls back to
+    loading the full page in Chrome for that and for any field left empty.
+    """
+    jid = job_id(url)
+    try:
+        guest_url = LINKEDIN_GUEST_URL.format(jid)
+        wait_for_host(guest_url)
+        response = get_worker_session().get(guest_url, timeout=10)
+        response.raise_for_status()
+        tree = lxml.html.fromstring(response.text)
+    except Exception as e:
+        print(f"  Guest endpoint failed for job {jid}: {str(e)}")
         return None
 
-    time_str = time_str.lower()
+    def texts(selector):
+        return [' '.join(element.text_content().split()) for element in tree.cssselect(selector)]
 
-    # Extract number and unit
-    match = re.search(r'(\d+)\s*(minute|hour|day|week|month)', time_str)
-    if not match:
+    job_title = next((text for sel in TITLE_SELECTORS for text in texts(sel)[:1] if text), None)
+    if not job_title:
+        return None
+    company = next((text for sel in COMPANY_SELECTORS for text in texts(sel)[:1] if text), None)
+    posted_time = next(
+        (text for sel in TIME_SELECTORS for text in texts(sel)
+         if any(word in text.lower() for word in TIME_WORDS)),
+        None
+    )
+
+    return {
+        'company': company,
+        'job_title': job_title,
+        'days_ago': parse_posted_time(posted_time) if posted_time else None
+    }
+
+
+def has_all_details(details):
+    """True when company, job title and posted time were all extracted."""
+    return bool(details and details['company'] and details['job_title']
+                and details['days_ago'] is not None)
+
+
+def merge_details(first, second):
+    """Combine two extraction results, filling fields missing from first with second's."""
+    if not first or not second:
+        return first or second
+    return {key: first[key] if first[key] not in (None, '') else second[key] for key in first}
+
+
+def open_cache(path=CACHE_PATH):
+    """Open the details cache, creating the database and table if needed."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS job_details("
+        "job_id TEXT PRIMARY KEY, company TEXT, title TEXT, days_ago INTEGER, ts REAL)"
+    )
+    return conn
+
+
+def get_cached_details(conn, jid):
+    """Return complete details cached for a job ID within the TTL, else None.
+
+    days_ago is aged by the days elapsed since the details were extracted. Partial
+    entries (written by older versions) count as a miss so the job is scraped again.
+    """
+    row = conn.execute(
+        "SELECT company, title, days_ago, ts FROM job_details WHERE job_id = ? AND ts > ?",
+        (jid, time.time() - CACHE_TTL_SECONDS)
+    ).fetchone()
+    if not row:
         return None
 
-    num = int(match.group(1))
-    unit = match.group(2)
+    company, job_title, days_ago, ts = row
+    details = {'company': company, 'job_title': job_title, 'days_ago': days_ago}
+    if not has_all_details(details):
+        return None
 
-    if 'minute' in unit:
-        return 0
-    elif 'hour' in unit:
-        return 0
-    elif 'day' in unit:
-        return num
-    elif 'week' in unit:
-        return num * 7
-    elif 'month' in unit:
-        return num * 30
+    details['days_ago'] += int((time.time() - ts) // 86400)
+    return details
 
-    return None
+
+def store_cached_details(conn, jid, details):
+    """Record extracted details for a job ID; partial details are not cached."""
+    if not has_all_details(details):
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO job_details(job_id, company, title, days_ago, ts) VALUES (?, ?, ?, ?, ?)",
+        (jid, details['company'], details['job_title'], details['days_ago'], time.time())
+    )
+    conn.commit()
+
+
+def process_row(url):
+    """Extract job details in a worker thread using that thread's own session/browser.
+
+    Fresh results come from the cache, without starting a browser; only complete
+    results are cached, so a row still missing a column is scraped again next run.
+    """
+    cache = get_worker_cache(open_cache)
+    jid = job_id(url)
+    details = get_cached_details(cache, jid)
+    if details:
+        print(f"  Using cached details for job {jid}")
+        return details
+
+    # Plain HTTP first; Chrome only when the guest endpoint fails or leaves a field empty
+    details = extract_guest_job_details(url)
+    if not has_all_details(details):
+        try:
+            # Named apart from job_descriptions_extractor.py's profiles so both can run at once
+            driver = get_worker_driver("scraper")
+        except WebDriverException as e:
+            print(f"  Could not start Chrome: {e.msg}")
+            return details
+        wait_for_host(url)
+        details = merge_details(details, extract_job_details(driver, url))
+    store_cached_details(cache, jid, details)
+    return details
+
+
+def parse_posted_time(time_str):
+    """Convert posted time string to number of days."""
+    if not time_str:
+        return None
+
+    # Extract number and unit, then scale by the unit's length in days
+    match = _POSTED_TIME.search(time_str.lower())
+    if not match:
+        return None
+    return int(match.group(1)) * _DAYS_PER_UNIT[match.group(2)]
 
 
 def main():
     excel_path = "Job Tracker.xlsx"
 
-    # Load workbook with openpyxl to access hyperlinks
+    # Load workbook with openpyxl to access hyperlinks (not read_only: read-only
+    # worksheets drop cell hyperlinks, and the workbook is written back anyway)
     print(f"Reading {excel_path}...")
     wb = load_workbook(excel_path)
     ws = wb.active
 
     # Find header row and column indices
     headers = {}
-    for col in range(1, ws.max_column + 1):
-        header = ws.cell(row=1, column=col).value
+    header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    for col, header in enumerate(header_row, start=1):
         if header:
             headers[header] = col
 
@@ -214,22 +324,28 @@ def main():
 
     print(f"Total rows: {ws.max_row}")
 
-    # Find rows that need processing
+    # Find rows that need processing, streaming rows instead of looking up each cell
     rows_to_process = []
-    for row in range(2, ws.max_row + 1):  # Start from row 2 (skip header)
-        link_cell = ws.cell(row=row, column=link_col)
-        url = get_url_from_cell(link_cell)
+    link_i, company_i, job_title_i, days_i = link_col - 1, company_col - 1, job_title_col - 1, days_col - 1
+    last_col = max(link_col, company_col, job_title_col, days_col)
+    for cells in ws.iter_rows(min_row=2, max_col=last_col):  # Skip header
+        url = get_url_from_cell(cells[link_i])
 
         if is_linkedin_job_url(url):
             # Check if any of Company, Job Title, or Days columns are empty
-            company = ws.cell(row=row, column=company_col).value
-            job_title = ws.cell(row=row, column=job_title_col).value
-            days_ago = ws.cell(row=row, column=days_col).value
+            company = cells[company_i].value
+            job_title = cells[job_title_i].value
+            days_ago = cells[days_i].value
 
             if not company or not job_title or days_ago is None:
                 rows_to_process.append({
-                    'row': row,
+                    'row': cells[0].row,
                     'url': url,
+                    'job_id': job_id(url),
+                    # Kept to write results back without looking the cells up again
+                    'company_cell': cells[company_i],
+                    'job_title_cell': cells[job_title_i],
+                    'days_cell': cells[days_i],
                     'missing': {
                         'company': not company,
                         'job_title': not job_title,
@@ -250,11 +366,24 @@ def main():
     if len(rows_to_process) > 10:
         print(f"  ... and {len(rows_to_process) - 10} more")
 
-    # Set up the browser
-    print("\nSetting up browser...")
-    driver = setup_driver()
+    # Start browser workers; the workbook is only touched from this thread
+    print(f"\nStarting {MAX_PARALLEL_PAGES} browser workers...")
+    executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_PAGES)
 
+    pending_writes = 0
     try:
+        # One extraction per job ID, however many rows link to it; rows are
+        # filled in order while later jobs are still loading
+        futures = {}
+        for item in rows_to_process:
+            if item['job_id'] not in futures:
+                futures[item['job_id']] = executor.submit(
+                    process_row, LINKEDIN_VIEW_URL.format(item['job_id'])
+                )
+        duplicates = len(rows_to_process) - len(futures)
+        if duplicates:
+            print(f"  {duplicates} duplicate job links will reuse an earlier extraction")
+
         # Process each row
         for i, item in enumerate(rows_to_process):
             row = item['row']
@@ -262,14 +391,14 @@ def main():
             print(f"\n[{i+1}/{len(rows_to_process)}] Processing row {row}...")
             print(f"  URL: {url[:60]}...")
 
-            details = extract_job_details(driver, url)
+            details = futures[item['job_id']].result()
 
             if details:
                 if details['company'] and item['missing']['company']:
-                    ws.cell(row=row, column=company_col).value = details['company']
+                    item['company_cell'].value = details['company']
                     print(f"  Company: {details['company']}")
                 if details['job_title'] and item['missing']['job_title']:
-                    job_cell = ws.cell(row=row, column=job_title_col)
+                    job_cell = item['job_title_cell']
                     job_cell.value = details['job_title']
                     # Add hyperlink to the job title cell
                     job_cell.hyperlink = url
@@ -277,26 +406,28 @@ def main():
                     job_cell.font = Font(color="0000FF", underline="single")
                     print(f"  Job Title: {details['job_title']} (with hyperlink)")
                 if details['days_ago'] is not None and item['missing']['days_ago']:
-                    ws.cell(row=row, column=days_col).value = details['days_ago']
+                    item['days_cell'].value = details['days_ago']
                     print(f"  Days ago: {details['days_ago']}")
 
-                # Save after each successful extraction (in case of crashes)
-                wb.save(excel_path)
-                print("  Saved to file.")
+                # Save in batches; the finally below persists the last one on
+                # errors and Ctrl+C (KeyboardInterrupt) as well
+                pending_writes += 1
+                if pending_writes >= SAVE_EVERY:
+                    wb.save(excel_path)
+                    pending_writes = 0
+                    print("  Saved to file.")
             else:
                 print("  Failed to extract details")
 
-            # Random delay between requests
-            if i < len(rows_to_process) - 1:
-                delay = random.uniform(3, 6)
-                print(f"  Waiting {delay:.1f}s before next request...")
-                time.sleep(delay)
-
         print(f"\nDone! Processed {len(rows_to_process)} rows.")
 
     finally:
-        driver.quit()
-        wb.save(excel_path)
+        # Save before the (slower) browser shutdown so a second Ctrl+C loses nothing,
+        # but shut the workers down even when saving fails (e.g. file open in Excel)
+        try:
+            wb.save(excel_path)
+        finally:
+            shutdown_workers(executor)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,169 @@
+"""
+Shared browser / HTTP worker pool for linkedin_scraper.py and job_descriptions_extractor.py
+
+Each worker thread of a ThreadPoolExecutor owns its own headless Chrome, requests
+session and SQLite connection, created on first use. Requests to the same host are
+spaced out across all workers.
+"""
+
+import os
+import time
+import random
+import itertools
+import threading
+from collections import defaultdict
+from urllib.parse import urlparse
+import requests
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# LinkedIn serves job postings as static HTML to logged-out visitors here
+LINKEDIN_GUEST_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{}"
+
+# Resources Chrome never downloads - only the page text is scraped
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff*", "*.mp4", "*.css",
+    "*google-analytics*", "*doubleclick*", "*/tracking/*", "*/li/track*",
+]
+
+# Seconds between two requests to the same host (randomized to avoid detection);
+# different hosts are not throttled against each other, so LinkedIn-only runs are
+# effectively paced one request at a time across all workers
+HOST_INTERVAL = (2, 4)
+
+# Each worker's Chrome keeps a persistent profile here so its HTTP cache, cookies and
+# consent state stay warm across jobs and runs (one profile per worker, Chrome locks them)
+PROFILE_ROOT = os.path.abspath(".chrome-profile")
+DISK_CACHE_BYTES = 100 * 1024 * 1024
+
+# SQLite cache shared by both scripts, one table each
+CACHE_PATH = "cache.db"
+# Cached results younger than this are reused instead of loading the page again
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Each worker thread owns one driver; all of them are tracked so they can be shut down
+_worker_state = threading.local()
+_worker_drivers = []
+_worker_drivers_lock = threading.Lock()
+_worker_ids = itertools.count(1)
+
+# Per-host politeness: time of the last request and a lock so workers queue per host
+_host_last_hit = defaultdict(float)
+_host_locks = defaultdict(threading.Lock)
+_host_locks_guard = threading.Lock()
+
+
+def setup_driver(profile_dir=None):
+    """Set up Chrome driver with options to avoid detection.
+
+    With profile_dir, Chrome reuses that user data directory (and its disk cache).
+    """
+    chrome_options = Options()
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument("--profile-directory=Default")
+        chrome_options.add_argument(f"--disk-cache-size={DISK_CACHE_BYTES}")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process,TranslateUI")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--disable-background-networking")
+    # Keeps desktop layouts (and their selectors) in headless mode, whose default viewport is 800x600
+    chrome_options.add_argument("--window-size=1920,1080")
+    # A real desktop UA matters: the default headless one gets slower / challenge pages
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    # Skip images, fonts, media, stylesheets and trackers
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+
+def get_worker_driver(profile_prefix="worker"):
+    """Return the Chrome driver owned by the current worker thread, starting it on first use.
+
+    Its profile is PROFILE_ROOT/<profile_prefix>-N; each script uses its own prefix so
+    both can run at once. Raises WebDriverException when Chrome cannot be started at all.
+    """
+    driver = getattr(_worker_state, 'driver', None)
+    if driver is None:
+        profile_dir = os.path.join(PROFILE_ROOT, f"{profile_prefix}-{next(_worker_ids)}")
+        try:
+            driver = setup_driver(profile_dir)
+        except WebDriverException as e:
+            # Usually the profile is still locked by a Chrome left over from a killed run
+            print(f"  Could not start Chrome with {profile_dir} ({e.msg}); using a temporary profile")
+            driver = setup_driver()
+        _worker_state.driver = driver
+        with _worker_drivers_lock:
+            _worker_drivers.append(driver)
+    return driver
+
+
+def quit_worker_drivers():
+    """Shut down every Chrome driver started by the worker pool."""
+    with _worker_drivers_lock:
+        drivers = list(_worker_drivers)
+        _worker_drivers.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def get_worker_session():
+    """Return the HTTP session owned by the current worker thread (keeps connections alive)."""
+    session = getattr(_worker_state, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        _worker_state.session = session
+    return session
+
+
+def get_worker_cache(open_cache):
+    """Return the cache connection owned by the current worker thread.
+
+    open_cache is the calling script's opener, which creates its own table.
+    """
+    conn = getattr(_worker_state, 'cache', None)
+    if conn is None:
+        conn = open_cache()
+        _worker_state.cache = conn
+    return conn
+
+
+def wait_for_host(url):
+    """Block until the URL's host may be requested again, then claim that slot."""
+    host = urlparse(url).netloc
+    with _host_locks_guard:
+        lock = _host_locks[host]
+    with lock:
+        delay = _host_last_hit[host] + random.uniform(*HOST_INTERVAL) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        _host_last_hit[host] = time.monotonic()
+
+
+def shutdown_workers(executor):
+    """Cancel queued jobs, wait for the worker threads and quit their browsers."""
+    executor.shutdown(wait=False, cancel_futures=True)
+    quit_worker_drivers()  # Unblocks workers still waiting on a page load
+    executor.shutdown(wait=True)
+    quit_worker_drivers()  # Drivers started by jobs that were already running
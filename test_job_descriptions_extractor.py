@@ -0,0 +1,23 @@
+import lxml.html
+
+from job_descriptions_extractor import format_description_from_element, format_description_from_html
+
+
+def test_text_after_comment_placeholders_is_kept():
+    html = ('<div class="show-more-less-html__markup"><!---->We are hiring<!----> engineers.'
+            '<br>Apply now</div>')
+    assert format_description_from_html(html) == 'We are hiring engineers.\nApply now'
+
+
+def test_bullets_keep_text_after_comments():
+    html = '<ul><li>Design<!----> chips</li><li><!---->Test &amp; verify</li></ul>'
+    assert format_description_from_html(html) == '• Design chips\n• Test & verify'
+
+
+def test_parsed_element_with_comments():
+    tree = lxml.html.fromstring(
+        '<html><body><div class="description"><p>Intro<!----> text</p>'
+        '<script>track()</script><p>Bye</p></div></body></html>'
+    )
+    element = tree.cssselect('.description')[0]
+    assert format_description_from_element(element) == 'Intro text\n\nBye'